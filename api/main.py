@@ -1,12 +1,362 @@
-from fastapi import FastAPI, HTTPException, Query
-from fastapi.responses import JSONResponse
-from youtube_transcript_api import YouTubeTranscriptApi
-from youtube_transcript_api.formatters import TextFormatter
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from youtube_transcript_api import (
+    NoTranscriptFound,
+    TooManyRequests,
+    TranscriptsDisabled,
+    VideoUnavailable,
+    YouTubeRequestFailed,
+)
+from youtube_transcript_api._transcripts import TranscriptListFetcher
+from cachetools import TTLCache
+from slowapi import Limiter
+from slowapi.errors import RateLimitExceeded
+from slowapi.util import get_remote_address
+import anyio.to_thread
+import asyncio
+import hashlib
+import httpx
+import orjson
+import os
+import random
 import re
 import requests
+import threading
+
+# Use uvloop's C event loop when available - the whole service is I/O-bound
+# on outbound HTTP, so the faster loop is a free throughput win
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
 
 # Initialize FastAPI app
-app = FastAPI(title="YouTube Transcript API", version="1.0.0")
+app = FastAPI(title="YouTube Transcript API", version="1.0.0", default_response_class=ORJSONResponse)
+
+# Fixed-window rate limit per client IP, so one abusive client can't burn the
+# YouTube quota budget for everyone. headers_enabled adds Retry-After on 429s.
+limiter = Limiter(key_func=get_remote_address, headers_enabled=True)
+app.state.limiter = limiter
+
+
+@app.exception_handler(RateLimitExceeded)
+async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
+    response = ORJSONResponse(
+        status_code=429,
+        content={"code": "agent.rate_limited", "detail": f"Rate limit exceeded: {exc.detail}"}
+    )
+    return limiter._inject_headers(response, request.state.view_rate_limit)
+
+# Process-local caches - YouTube transcript data is near-static, so repeat
+# requests can be served without another network round-trip. Language lists
+# are reference data and get a longer TTL.
+_transcript_cache = TTLCache(maxsize=10_000, ttl=3600)
+_languages_cache = TTLCache(maxsize=10_000, ttl=86400)
+# Raw TranscriptList objects, shared by every endpoint that needs the list
+_transcript_list_cache = TTLCache(maxsize=10_000, ttl=3600)
+# In-flight fetches keyed like the caches, so N concurrent requests for the
+# same video collapse into a single outbound YouTube call
+_inflight = {}
+
+
+async def _single_flight(cache, cache_key, fetch):
+    """Cache-aside lookup with single-flight coalescing: the first miss runs
+    `fetch` and warms the cache, concurrent misses await the same future."""
+    if cache_key in cache:
+        return cache[cache_key]
+
+    fut = _inflight.get(cache_key)
+    if fut is not None:
+        return await fut
+
+    fut = asyncio.get_running_loop().create_future()
+    _inflight[cache_key] = fut
+    try:
+        response = await fetch()
+        cache[cache_key] = response
+        fut.set_result(response)
+        return response
+    except BaseException as exc:
+        fut.set_exception(exc)
+        # Mark the exception as retrieved in case nobody else was waiting
+        fut.exception()
+        raise
+    finally:
+        _inflight.pop(cache_key, None)
+
+
+# YouTube video IDs are always 11 URL-safe characters. Validating up-front
+# (and pulling the ID out of pasted URLs) avoids paying a doomed network
+# round-trip for malformed input, and normalizes cache keys so a bare ID and
+# a full URL share the same cache slot.
+_VIDEO_ID_RE = re.compile(r'^[A-Za-z0-9_-]{11}$')
+_URL_RE = re.compile(r'(?:v=|youtu\.be/|/shorts/|/embed/)([A-Za-z0-9_-]{11})')
+
+
+def _normalize_video_id(video_id):
+    """Extract the 11-character video ID, rejecting malformed input with a 400"""
+    if video_id:
+        match = _URL_RE.search(video_id)
+        if match:
+            video_id = match.group(1)
+        if _VIDEO_ID_RE.match(video_id):
+            return video_id
+    raise HTTPException(status_code=400, detail="Invalid YouTube video ID or URL")
+
+
+# One pooled HTTP/2 client for direct fetches - it keeps TLS connections
+# alive and multiplexes concurrent fetches instead of paying a handshake per
+# call. Proxied calls get a short-lived client instead: memoizing per proxy
+# string would let callers grow an unbounded set of retained clients via
+# arbitrary ?proxy= values. Creation is locked because _pooled_client runs on
+# threadpool worker threads.
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+class _CompatResponse:
+    """Minimal wrapper so youtube_transcript_api, which expects requests
+    semantics, can consume httpx responses"""
+
+    def __init__(self, response):
+        self._response = response
+
+    @property
+    def text(self):
+        return self._response.text
+
+    def raise_for_status(self):
+        try:
+            self._response.raise_for_status()
+        except httpx.HTTPStatusError as error:
+            raise requests.HTTPError(str(error))
+
+
+class _CompatClient(httpx.Client):
+    """httpx.Client whose get() returns requests-compatible responses"""
+
+    def get(self, url, **kwargs):
+        return _CompatResponse(super().get(url, **kwargs))
+
+
+def _new_client(proxy=None):
+    return _CompatClient(
+        http2=True,
+        timeout=10,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=100),
+        proxy=proxy,
+    )
+
+
+def _pooled_client():
+    client = _clients.get(None)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(None)
+            if client is None:
+                client = _new_client()
+                _clients[None] = client
+    return client
+
+
+def _list_transcripts(video_id, proxy=None):
+    """Like YouTubeTranscriptApi.list_transcripts, on the pooled HTTP/2
+    client for direct calls or a short-lived one for proxied calls"""
+    if proxy is None:
+        return TranscriptListFetcher(_pooled_client()).fetch(video_id)
+    with _new_client(proxy) as client:
+        return TranscriptListFetcher(client).fetch(video_id)
+
+
+def _fetch_transcript_via_proxy(video_id, languages, proxy):
+    """List and fetch in one shot over a short-lived proxied client, which
+    has to stay open until the transcript data is materialized"""
+    with _new_client(proxy) as client:
+        return TranscriptListFetcher(client).fetch(video_id).find_transcript(languages).fetch()
+
+
+# Retry policy for transient YouTube failures (429s, network errors)
+_RETRY_ATTEMPTS = 3
+_RETRY_BASE_DELAY = 1.0
+_RETRY_MAX_DELAY = 30.0
+_TRANSIENT_ERRORS = (TooManyRequests, YouTubeRequestFailed, httpx.HTTPError, requests.exceptions.RequestException)
+
+
+def _youtube_blocked(error):
+    """503 with Retry-After for a transient failure that outlived the retries"""
+    return HTTPException(
+        status_code=503,
+        detail=f"YouTube is blocking requests. Try: 1) Different video ID, 2) Add ?proxy=YOUR_PROXY_URL, 3) Try again later. Original error: {str(error)}",
+        headers={"Retry-After": str(int(_RETRY_MAX_DELAY))}
+    )
+
+
+async def _with_backoff(fn, *args):
+    """Run a blocking YouTube call in a thread, retrying transient failures
+    with exponential backoff plus jitter. Unrecoverable errors (no transcript,
+    video unavailable) are raised immediately without retrying. Dispatches via
+    anyio so the threadpool limiter sized at startup governs these calls."""
+    for attempt in range(_RETRY_ATTEMPTS):
+        try:
+            return await anyio.to_thread.run_sync(fn, *args)
+        except (NoTranscriptFound, TranscriptsDisabled, VideoUnavailable):
+            raise
+        except _TRANSIENT_ERRORS:
+            if attempt == _RETRY_ATTEMPTS - 1:
+                raise
+            delay = min(_RETRY_BASE_DELAY * 2 ** attempt, _RETRY_MAX_DELAY)
+            await asyncio.sleep(delay * (1 + random.uniform(0, 0.5)))
+
+
+# Responses with at least this many transcript entries are streamed in
+# chunks instead of being serialized into one large buffer
+_STREAM_THRESHOLD = 1000
+_STREAM_CHUNK_ENTRIES = 500
+
+
+def _iter_json_chunks(response_dict):
+    """Incrementally serialize the response, yielding the transcript array in
+    slices so multi-MB transcripts never exist as a single serialized blob"""
+    transcript = response_dict.get("transcript", [])
+    head = orjson.dumps({k: v for k, v in response_dict.items() if k != "transcript"})
+    yield head[:-1] + b',"transcript":['
+    for offset in range(0, len(transcript), _STREAM_CHUNK_ENTRIES):
+        chunk = orjson.dumps(transcript[offset:offset + _STREAM_CHUNK_ENTRIES])
+        # Strip the surrounding [] and splice the slices together with commas
+        yield chunk[1:-1] if offset == 0 else b"," + chunk[1:-1]
+    yield b"]}"
+
+
+def _compute_etag(response_dict):
+    """Hash the response body for the ETag header. Computed once when the
+    response is built and cached alongside it, never per request."""
+    return hashlib.md5(orjson.dumps(response_dict, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+def _cacheable_response(request, response_dict, etag, max_age=3600):
+    """Build a response with Cache-Control/ETag headers, honoring If-None-Match"""
+    # RFC 7232 entity-tags are quoted strings; bare hex would be ignored by
+    # spec-compliant caches
+    quoted_etag = f'"{etag}"'
+    headers = {
+        "Cache-Control": f"public, max-age={max_age}, stale-while-revalidate=600",
+        "ETag": quoted_etag
+    }
+    if request.headers.get("if-none-match") == quoted_etag:
+        return Response(status_code=304, headers=headers)
+    if len(response_dict.get("transcript", ())) >= _STREAM_THRESHOLD:
+        return StreamingResponse(_iter_json_chunks(response_dict), media_type="application/json", headers=headers)
+    return ORJSONResponse(content=response_dict, headers=headers)
+
+
+async def _get_transcript_list(video_id, proxy=None):
+    """One TranscriptList fetch per video, cached and single-flighted, so the
+    transcript, language-fallback and languages endpoints never duplicate it.
+    Proxied lookups bypass the cache: their short-lived client is closed by
+    the time a cached list would be reused."""
+    if proxy is not None:
+        return await _with_backoff(_list_transcripts, video_id, proxy)
+
+    async def fetch():
+        return await _with_backoff(_list_transcripts, video_id)
+
+    return await _single_flight(_transcript_list_cache, ("transcript_list", video_id), fetch)
+
+
+async def _fetch_and_format(video_id, proxy, language_code=None):
+    """Fetch a transcript and build the (response dict, etag) pair, shared by
+    both transcript endpoints. Serves from the TTL cache when warm; concurrent
+    misses for the same key collapse into one outbound call."""
+    async def fetch():
+        languages = [language_code] if language_code else ['en', 'en-US', 'en-GB']
+        if proxy is None:
+            transcript_list = await _get_transcript_list(video_id)
+            transcript = await _with_backoff(transcript_list.find_transcript(languages).fetch)
+        else:
+            transcript = await _with_backoff(_fetch_transcript_via_proxy, video_id, languages, proxy)
+
+        # The library already returns entries as {text, start, duration}
+        # dicts, so reuse them directly instead of rebuilding each one.
+        # join avoids quadratic string concatenation on long transcripts.
+        formatted_transcript = transcript
+        full_text = " ".join(entry['text'] for entry in transcript)
+
+        response = {"video_id": video_id}
+        if language_code:
+            response["language"] = language_code
+        response.update({
+            "transcript": formatted_transcript,
+            "full_text": full_text,
+            "total_entries": len(formatted_transcript),
+            "proxy_used": proxy is not None
+        })
+        return response, _compute_etag(response)
+
+    return await _single_flight(_transcript_cache, ("transcript", video_id, language_code, proxy), fetch)
+
+
+async def _fetch_available_languages(video_id, proxy):
+    """Fetch the language list for a video as a (response dict, etag) pair,
+    cached for 24h"""
+    async def fetch():
+        transcript_list = await _get_transcript_list(video_id, proxy)
+
+        available_languages = [
+            {
+                "language": transcript.language,
+                "language_code": transcript.language_code,
+                "is_generated": transcript.is_generated,
+                "is_translatable": transcript.is_translatable
+            }
+            for transcript in transcript_list
+        ]
+
+        response = {
+            "video_id": video_id,
+            "available_languages": available_languages,
+            "total_languages": len(available_languages),
+            "proxy_used": proxy is not None
+        }
+        return response, _compute_etag(response)
+
+    return await _single_flight(_languages_cache, ("transcript_languages", video_id, proxy), fetch)
+
+
+@app.on_event("startup")
+async def configure_threadpool():
+    """Size the threadpool so many blocking YouTube fetches can run in parallel"""
+    anyio.to_thread.current_default_thread_limiter().total_tokens = 200
+
+
+@app.on_event("startup")
+async def warm_cache():
+    """Prefetch transcripts for frequently-requested videos (comma-separated
+    HOT_VIDEO_IDS env var) so cold starts serve them from cache"""
+    video_ids = [v.strip() for v in os.environ.get("HOT_VIDEO_IDS", "").split(",") if v.strip()]
+    if not video_ids:
+        return
+
+    semaphore = asyncio.Semaphore(10)
+
+    async def prefetch(video_id):
+        async with semaphore:
+            try:
+                await _fetch_and_format(video_id, None)
+            except Exception:
+                # Warming is best-effort - a bad or blocked ID must not stop startup
+                pass
+
+    await asyncio.gather(*(prefetch(video_id) for video_id in video_ids))
+
+
+@app.on_event("shutdown")
+async def close_http_clients():
+    """Close the pooled HTTP clients so connections are torn down cleanly"""
+    for client in _clients.values():
+        client.close()
+    _clients.clear()
 
 
 @app.get("/")
@@ -36,194 +386,105 @@ def health_check():
     return {"status": "healthy", "service": "YouTube Transcript API"}
 
 @app.get("/api/transcript/{video_id}")
-def get_transcript(video_id: str, proxy: str = Query(None, description="Proxy URL (optional)")):
+@limiter.limit("30/minute")
+async def get_transcript(video_id: str, request: Request, proxy: str = Query(None, description="Proxy URL (optional)")):
     """Get transcript for a YouTube video (defaults to English)"""
     try:
-        # Extract video ID if URL is provided
-        if not video_id:
-            raise HTTPException(status_code=400, detail="Invalid YouTube video ID or URL")
-        
-        # Set up proxy if provided
-        proxies = None
-        if proxy:
-            proxies = {"http": proxy, "https": proxy}
-        
-        # Get transcript with retry mechanism
-        transcript = None
+        # Extract and validate the video ID before touching the network
+        video_id = _normalize_video_id(video_id)
+
+        # Get transcript, backing off on transient failures instead of
+        # immediately re-hammering YouTube with fallback requests
         try:
-            if proxies:
-                # Custom session with proxy
-                session = requests.Session()
-                session.proxies = proxies
-                transcript = YouTubeTranscriptApi.get_transcript(video_id, proxies=proxies)
-            else:
-                transcript = YouTubeTranscriptApi.get_transcript(video_id)
-        except Exception as first_error:
-            # If first attempt fails, try with different languages
-            try:
-                transcript = YouTubeTranscriptApi.get_transcript(video_id, languages=['en', 'en-US', 'en-GB'])
-            except Exception as second_error:
-                # If still fails, try to get any available transcript
-                try:
-                    transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
-                    transcript = transcript_list.find_transcript(['en', 'en-US']).fetch()
-                except Exception:
-                    # If all fails, return the original error with helpful message
-                    raise HTTPException(
-                        status_code=503, 
-                        detail=f"YouTube is blocking requests. Try: 1) Different video ID, 2) Add ?proxy=YOUR_PROXY_URL, 3) Try again later. Original error: {str(first_error)}"
-                    )
-        
-        # Format response
-        formatted_transcript = []
-        full_text = ""
-        
-        for entry in transcript:
-            formatted_entry = {
-                "text": entry['text'],
-                "start": entry['start'],
-                "duration": entry['duration']
-            }
-            formatted_transcript.append(formatted_entry)
-            full_text += entry['text'] + " "
-        
-        return {
-            "video_id": video_id,
-            "transcript": formatted_transcript,
-            "full_text": full_text.strip(),
-            "total_entries": len(formatted_transcript),
-            "proxy_used": proxy is not None
-        }
-        
+            response, etag = await _fetch_and_format(video_id, proxy)
+        except _TRANSIENT_ERRORS as first_error:
+            # Retries exhausted - tell clients when it is worth coming back
+            raise _youtube_blocked(first_error)
+
+        return _cacheable_response(request, response, etag)
+
     except HTTPException:
         raise
+    except (NoTranscriptFound, TranscriptsDisabled):
+        raise HTTPException(status_code=404, detail="No transcripts found for this video")
+    except VideoUnavailable:
+        raise HTTPException(status_code=404, detail="Video not found or unavailable")
     except Exception as e:
-        error_msg = str(e)
-        if "No transcripts were found" in error_msg:
-            raise HTTPException(status_code=404, detail="No transcripts found for this video")
-        elif "Video unavailable" in error_msg:
-            raise HTTPException(status_code=404, detail="Video not found or unavailable")
-        else:
-            raise HTTPException(status_code=500, detail=f"Error retrieving transcript: {error_msg}")
+        raise HTTPException(status_code=500, detail=f"Error retrieving transcript: {str(e)}")
 
 @app.get("/api/transcript-{language_code}/{video_id}")
-def get_transcript_with_language(language_code: str, video_id: str, proxy: str = Query(None, description="Proxy URL (optional)")):
+@limiter.limit("30/minute")
+async def get_transcript_with_language(language_code: str, video_id: str, request: Request, proxy: str = Query(None, description="Proxy URL (optional)")):
     """Get transcript for a YouTube video in specific language"""
     try:
-        # Extract video ID if URL is provided
-        if not video_id:
-            raise HTTPException(status_code=400, detail="Invalid YouTube video ID or URL")
-        
-        # Set up proxy if provided
-        proxies = None
-        if proxy:
-            proxies = {"http": proxy, "https": proxy}
-        
+        # Extract and validate the video ID before touching the network
+        video_id = _normalize_video_id(video_id)
+
+        # Short-circuit when the cached language list already says this
+        # language isn't available - no need to hit YouTube at all
+        cached_languages = _languages_cache.get(("transcript_languages", video_id, proxy))
+        if cached_languages is not None:
+            known_codes = [lang["language_code"] for lang in cached_languages[0]["available_languages"]]
+            if language_code not in known_codes:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"No transcript found for language '{language_code}'. Available languages: {', '.join(known_codes)}"
+                )
+
         # Get transcript in specific language
         try:
-            if proxies:
-                # Custom session with proxy
-                session = requests.Session()
-                session.proxies = proxies
-                transcript = YouTubeTranscriptApi.get_transcript(video_id, languages=[language_code], proxies=proxies)
-            else:
-                transcript = YouTubeTranscriptApi.get_transcript(video_id, languages=[language_code])
-        except Exception as e:
-            # If the specific language fails, try to get available transcripts and suggest alternatives
+            response, etag = await _fetch_and_format(video_id, proxy, language_code)
+        except NoTranscriptFound:
+            # Only a language miss gets the suggestion treatment; anything
+            # else (video unavailable, transcripts disabled) falls through to
+            # its dedicated handler below. Alternatives come from the cached
+            # language list instead of a second network round-trip
             try:
-                transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
-                available_langs = [t.language_code for t in transcript_list]
-                raise HTTPException(
-                    status_code=404, 
-                    detail=f"No transcript found for language '{language_code}'. Available languages: {', '.join(available_langs)}"
-                )
+                languages_response, _ = await _fetch_available_languages(video_id, proxy)
+                available_langs = [lang["language_code"] for lang in languages_response["available_languages"]]
             except Exception:
                 raise HTTPException(status_code=404, detail=f"No transcripts found for this video in language: {language_code}")
-        
-        # Format response
-        formatted_transcript = []
-        full_text = ""
-        
-        for entry in transcript:
-            formatted_entry = {
-                "text": entry['text'],
-                "start": entry['start'],
-                "duration": entry['duration']
-            }
-            formatted_transcript.append(formatted_entry)
-            full_text += entry['text'] + " "
-        
-        return {
-            "video_id": video_id,
-            "language": language_code,
-            "transcript": formatted_transcript,
-            "full_text": full_text.strip(),
-            "total_entries": len(formatted_transcript),
-            "proxy_used": proxy is not None
-        }
-        
+            raise HTTPException(
+                status_code=404,
+                detail=f"No transcript found for language '{language_code}'. Available languages: {', '.join(available_langs)}"
+            )
+
+        return _cacheable_response(request, response, etag)
+
     except HTTPException:
         raise
+    except (NoTranscriptFound, TranscriptsDisabled):
+        raise HTTPException(status_code=404, detail=f"No transcripts found for this video in language: {language_code}")
+    except VideoUnavailable:
+        raise HTTPException(status_code=404, detail="Video not found or unavailable")
+    except _TRANSIENT_ERRORS as e:
+        # Retries exhausted - tell clients when it is worth coming back
+        raise _youtube_blocked(e)
     except Exception as e:
-        error_msg = str(e)
-        if "No transcripts were found" in error_msg:
-            raise HTTPException(status_code=404, detail=f"No transcripts found for this video in language: {language_code}")
-        elif "Video unavailable" in error_msg:
-            raise HTTPException(status_code=404, detail="Video not found or unavailable")
-        else:
-            raise HTTPException(status_code=500, detail=f"Error retrieving transcript: {error_msg}")
+        raise HTTPException(status_code=500, detail=f"Error retrieving transcript: {str(e)}")
 
 @app.get("/api/transcript_languages/{video_id}")
-def get_available_languages(video_id: str, proxy: str = Query(None, description="Proxy URL (optional)")):
+@limiter.limit("30/minute")
+async def get_available_languages(video_id: str, request: Request, proxy: str = Query(None, description="Proxy URL (optional)")):
     """Get available transcript languages for a video"""
     try:
-        # Extract video ID if URL is provided
-        if not video_id:
-            raise HTTPException(status_code=400, detail="Invalid YouTube video ID or URL")
-        
-        # Set up proxy if provided
-        proxies = None
-        if proxy:
-            proxies = {"http": proxy, "https": proxy}
-        
+        # Extract and validate the video ID before touching the network
+        video_id = _normalize_video_id(video_id)
+
         # Get available transcripts
-        try:
-            if proxies:
-                # Note: YouTubeTranscriptApi.list_transcripts doesn't directly support proxies
-                # but we can try to use the session approach
-                transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
-            else:
-                transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
-        except Exception as e:
-            if "Video unavailable" in str(e):
-                raise HTTPException(status_code=404, detail="Video not found or unavailable")
-            else:
-                raise HTTPException(status_code=500, detail=f"Error retrieving languages: {str(e)}")
-        
-        available_languages = []
-        for transcript in transcript_list:
-            available_languages.append({
-                "language": transcript.language,
-                "language_code": transcript.language_code,
-                "is_generated": transcript.is_generated,
-                "is_translatable": transcript.is_translatable
-            })
-        
-        return {
-            "video_id": video_id,
-            "available_languages": available_languages,
-            "total_languages": len(available_languages),
-            "proxy_used": proxy is not None
-        }
-        
+        response, etag = await _fetch_available_languages(video_id, proxy)
+
+        return _cacheable_response(request, response, etag, max_age=86400)
+
     except HTTPException:
         raise
+    except (VideoUnavailable, TranscriptsDisabled):
+        raise HTTPException(status_code=404, detail="Video not found or unavailable")
+    except _TRANSIENT_ERRORS as e:
+        # Retries exhausted - tell clients when it is worth coming back
+        raise _youtube_blocked(e)
     except Exception as e:
-        error_msg = str(e)
-        if "Video unavailable" in error_msg:
-            raise HTTPException(status_code=404, detail="Video not found or unavailable")
-        else:
-            raise HTTPException(status_code=500, detail=f"Error retrieving languages: {error_msg}")
+        raise HTTPException(status_code=500, detail=f"Error retrieving languages: {str(e)}")
 
 # This is crucial for Vercel - must be at the end
 handler = app
\ No newline at end of file